@@ -1,8 +1,9 @@
 import argparse
-from flask import Flask, jsonify, render_template_string
+from flask import Flask, Response, jsonify, render_template_string, request
 import threading
 import cv2
 from thermal_sensor import ThermalEngine
+from frame_stream import ThermalFrameStream
 from mouse_drag_handler import MouseDragHandler
 import time
 import logging
@@ -44,6 +45,7 @@ def watchdog_thread_function():
 
 app = Flask(__name__)
 engine = ThermalEngine()
+frame_stream = ThermalFrameStream()
 HTML_PAGE = """
 <!DOCTYPE html>
 <html>
@@ -55,7 +57,7 @@ HTML_PAGE = """
         display: flex; flex-direction: column; font-family: sans-serif;
     }
     h1 { position: absolute; top: 10px; left: 50%; transform: translateX(-50%); z-index: 10; font-size: 1.2rem; opacity: 0.5; pointer-events: none; }
-    canvas { display: block; width: 100vw; height: 100vh; }
+    canvas { display: block; position: absolute; top: 0; left: 0; width: 100vw; height: 100vh; }
     
     #controls { 
         position: absolute; top: 10px; right: 20px; z-index: 20;
@@ -94,8 +96,14 @@ HTML_PAGE = """
     <h1>THERMAL MONITOR LIVE</h1>
     <div id="controls">
         <label><input type="checkbox" id="unitToggle"> Fahrenheit (°F)</label>
+        <select id="strideSelect" onchange="streamHeatmap()" style="margin-left:10px;">
+            <option value="1">Full res</option>
+            <option value="2" selected>Half res</option>
+            <option value="4">Quarter res</option>
+        </select>
         <button onclick="document.documentElement.requestFullscreen()" style="margin-left:10px; cursor:pointer;">Full Screen</button>
     </div>
+    <canvas id="heat"></canvas>
     <canvas id="c"></canvas>
     <div id="status">Server Connection: Online</div>
 
@@ -232,6 +240,93 @@ async function update() {
     }
 }
 setInterval(update, 1500);
+
+// --- Heatmap: raw 16-bit thermal grid streamed from /api/thermal_stream ---
+const heat = document.getElementById('heat');
+const heatCtx = heat.getContext('2d');
+// Frame header: kind(u8) stride(u8) width(u16) height(u16) seq(u32) length(u32), little endian
+const HEADER_SIZE = 14;
+const KEY_FRAME = 0;
+
+// 256 entry lookup approximating cv2.COLORMAP_JET
+const JET = new Uint8ClampedArray(256 * 3);
+for (let i = 0; i < 256; i++) {
+    const v = i / 255;
+    JET[i * 3]     = 255 * Math.max(0, Math.min(1, 1.5 - Math.abs(4 * v - 3)));
+    JET[i * 3 + 1] = 255 * Math.max(0, Math.min(1, 1.5 - Math.abs(4 * v - 2)));
+    JET[i * 3 + 2] = 255 * Math.max(0, Math.min(1, 1.5 - Math.abs(4 * v - 1)));
+}
+
+let raw = null;          // Last decoded frame, raw sensor counts
+let streamAbort = null;
+
+async function inflate(bytes) {
+    const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('deflate'));
+    return new Uint16Array(await new Response(stream).arrayBuffer());
+}
+
+function drawHeatmap(w, h) {
+    if (heat.width !== w || heat.height !== h) { heat.width = w; heat.height = h; }
+    // Stretch the palette over the current frame's range
+    let lo = Infinity, hi = -Infinity;
+    for (const v of raw) { if (v < lo) lo = v; if (v > hi) hi = v; }
+    const span = Math.max(1, hi - lo);
+    const img = heatCtx.createImageData(w, h);
+    for (let p = 0; p < raw.length; p++) {
+        const c = Math.round(255 * (raw[p] - lo) / span) * 3;
+        img.data[p * 4]     = JET[c];
+        img.data[p * 4 + 1] = JET[c + 1];
+        img.data[p * 4 + 2] = JET[c + 2];
+        img.data[p * 4 + 3] = 255;
+    }
+    heatCtx.putImageData(img, 0, 0);
+}
+
+async function streamHeatmap() {
+    if (streamAbort) streamAbort.abort();
+    const abort = streamAbort = new AbortController();
+    const stride = document.getElementById('strideSelect').value;
+    raw = null;
+    try {
+        const res = await fetch(`/api/thermal_stream?stride=${stride}`, { signal: abort.signal });
+        if (!res.ok) throw new Error(`Server Error: ${res.status}`);
+        const reader = res.body.getReader();
+        let buf = new Uint8Array(0);
+        while (true) {
+            const { done, value } = await reader.read();
+            if (done) break;
+            const merged = new Uint8Array(buf.length + value.length);
+            merged.set(buf);
+            merged.set(value, buf.length);
+            buf = merged;
+            while (buf.length >= HEADER_SIZE) {
+                const view = new DataView(buf.buffer, buf.byteOffset, HEADER_SIZE);
+                const kind = view.getUint8(0);
+                const w = view.getUint16(2, true);
+                const h = view.getUint16(4, true);
+                const len = view.getUint32(10, true);
+                if (buf.length < HEADER_SIZE + len) break;
+                const grid = await inflate(buf.subarray(HEADER_SIZE, HEADER_SIZE + len));
+                buf = buf.slice(HEADER_SIZE + len);
+                if (kind === KEY_FRAME) {
+                    raw = grid;
+                } else if (raw && raw.length === grid.length) {
+                    // Uint16Array addition wraps modulo 2^16, mirroring the server's delta
+                    for (let p = 0; p < grid.length; p++) raw[p] += grid[p];
+                } else {
+                    continue;
+                }
+                drawHeatmap(w, h);
+            }
+        }
+    } catch (e) {
+        if (abort.signal.aborted) return;
+        console.error("Heatmap stream lost:", e);
+    }
+    // Reconnect unless a newer stream replaced this one
+    if (!abort.signal.aborted) setTimeout(() => { if (streamAbort === abort) streamHeatmap(); }, 2000);
+}
+streamHeatmap();
 </script>
 </body>
 </html>
@@ -244,6 +339,13 @@ def index(): return render_template_string(HTML_PAGE)
 def get_temps(): 
     return jsonify({s: {"temp": round(d['temp'],1), "center": d['center'], "radius": d['radius']} for s, d in engine.regions.items()})
 
+@app.route('/api/thermal_stream')
+def thermal_stream():
+    # Length-prefixed, zlib compressed, delta encoded raw thermal frames; see frame_stream.py
+    stride = request.args.get('stride', 1, type=int)
+    return Response(frame_stream.frames(stride), mimetype='application/octet-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
 def camera_worker():
     global last_heartbeat
 
@@ -275,6 +377,7 @@ def camera_worker():
             break
         
         processed = engine.process_frame(frame, produce_ui_image=args.local_gui)
+        frame_stream.publish(engine.raw_thermal)
         if args.local_gui:
             cv2.imshow("Thermal", processed)
         
@@ -0,0 +1,62 @@
+import struct
+import threading
+import zlib
+import numpy as np
+
+KEY_FRAME = 0
+DELTA_FRAME = 1
+# kind, stride, width, height, sequence number, payload length (little endian)
+HEADER = struct.Struct('<BBHHII')
+MAX_STRIDE = 8
+
+class ThermalFrameStream:
+    """
+    Fan out raw 16-bit thermal grids to any number of streaming clients.
+    Every frame is encoded at most once per (kind, stride) and the bytes are shared
+    by all clients, so server work stays flat as viewers are added.
+    """
+    def __init__(self, compress_level=1):
+        self.compress_level = compress_level
+        self.cond = threading.Condition()
+        self.seq = 0
+        self.raw = None
+        self.prev = None
+        self.cache = {}
+
+    def publish(self, raw):
+        if raw is None: return
+        with self.cond:
+            self.prev, self.raw = self.raw, raw
+            self.seq += 1
+            self.cache = {}
+            self.cond.notify_all()
+
+    def _encode(self, kind, stride):
+        # Must be called with self.cond held.
+        key = (kind, stride)
+        if key not in self.cache:
+            grid = self.raw[::stride, ::stride]
+            if kind == DELTA_FRAME:
+                # uint16 subtraction wraps modulo 2**16, the client adds it back the same way
+                grid = grid - self.prev[::stride, ::stride]
+            h, w = grid.shape
+            payload = zlib.compress(np.ascontiguousarray(grid, dtype='<u2').tobytes(), self.compress_level)
+            self.cache[key] = HEADER.pack(kind, stride, w, h, self.seq, len(payload)) + payload
+        return self.cache[key]
+
+    def frames(self, stride=1):
+        """
+        Yield encoded frames for one client: a key frame first, then deltas against the
+        previous frame for as long as the client keeps up. A skipped frame or a change
+        in the trimmed frame size falls back to a key frame.
+        """
+        stride = max(1, min(MAX_STRIDE, int(stride)))
+        last_seq = None
+        while True:
+            with self.cond:
+                self.cond.wait_for(lambda: self.raw is not None and self.seq != last_seq)
+                can_delta = (last_seq == self.seq - 1 and self.prev is not None
+                             and self.prev.shape == self.raw.shape)
+                data = self._encode(DELTA_FRAME if can_delta else KEY_FRAME, stride)
+                last_seq = self.seq
+            yield data
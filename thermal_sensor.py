@@ -9,6 +9,7 @@ class ThermalEngine:
     def __init__(self):
         self.regions = {}
         self.current_slot = '1'
+        self.raw_thermal = None
         self.load_regions()
 
     def load_regions(self):
@@ -55,6 +56,8 @@ class ThermalEngine:
         invalid_row = np.where(t[:,:,1]==0)[0].min()
         thermal = np.delete(t, range(invalid_row, t.shape[0], 1), axis=0)
         h, w = thermal.shape[:2]
+        # Raw 16-bit sensor counts (U is the upper byte) for streaming to clients
+        self.raw_thermal = thermal[:,:,1].astype(np.uint16) * 256 + thermal[:,:,0]
         for slot, data in self.regions.items():
             # Lazy mask creation/regeneration
             if data['mask'] is None or data['mask'].shape[:2] != (h, w):